@@ -9,21 +9,194 @@ A structured interface for controlling a robotic arm gripper via Modbus communic
 import sys
 import os
 import time
-from typing import Tuple, Optional
+import queue
+import asyncio
+import importlib.util
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Tuple, Optional
 
-# Set up module paths
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.extend([
-    ROOT_DIR,
-    os.path.join(ROOT_DIR, "Python"),
-    os.path.join(ROOT_DIR, "Python", "Robotic_Arm")
-])
+# Whether the SDK directories have been added to sys.path
+_SDK_PATH_SET = False
 
-from Robotic_Arm.rm_robot_interface import *
+logger = logging.getLogger(__name__)
+
+
+def _ensure_sdk_path() -> None:
+    """Make the bundled Robotic_Arm SDK importable without importing it."""
+    global _SDK_PATH_SET
+    if _SDK_PATH_SET:
+        return
+
+    # Set up module paths
+    for path in (ROOT_DIR,
+                 os.path.join(ROOT_DIR, "Python"),
+                 os.path.join(ROOT_DIR, "Python", "Robotic_Arm")):
+        if path not in sys.path:
+            sys.path.append(path)
+
+    if importlib.util.find_spec("Robotic_Arm") is None:
+        raise ImportError("Robotic_Arm SDK not found under " + os.path.join(ROOT_DIR, "Python"))
+    _SDK_PATH_SET = True
+
+
+def _clamp_position(position: int, strict: bool) -> int:
+    """Clamp a position to 0-255, or raise ValueError if strict and out of range."""
+    if strict and not 0 <= position <= 255:
+        raise ValueError("Position must be between 0 and 255")
+    return min(max(position, 0), 255)
+
+
+# Shared connections handed out by RQGripper.get(), keyed by (ip_address, port)
+_INSTANCES = {}
+
+
+class GripperFuture:
+    """Handle to a gripper move started by RQGripper.go_to_position."""
+
+    __slots__ = ('_gripper', '_position', '_seq', '_sent_at', '_acknowledged',
+                 '_cancelled', '_result')
+
+    def __init__(self, gripper: "RQGripper", position: int, sent: bool,
+                 seq: Optional[int] = None):
+        """
+        Args:
+            gripper: Gripper executing the move
+            position: Target position (0-255)
+            sent: Whether the move command was accepted by the arm
+            seq: Move sequence number taken when the move was issued;
+                defaults to the gripper's current one
+        """
+        self._gripper = gripper
+        self._position = position
+        self._seq = gripper._move_seq if seq is None else seq
+        self._sent_at = gripper._monotonic()
+        self._acknowledged = False
+        self._cancelled = False
+        # Outcome once known; a move that was never sent has already failed
+        self._result = None if sent else False
+
+    def _poll(self) -> Optional[bool]:
+        """
+        Return the recorded outcome, or check the gripper if still unknown.
+
+        Returns:
+            Optional[bool]: True if the move finished, False if it failed or
+            was stopped or replaced, None while still running
+        """
+        if self._result is None:
+            self._result = self._check()
+        return self._result
+
+    def _check(self) -> Optional[bool]:
+        """
+        Read the gripper state once and classify the move.
+
+        Returns:
+            Optional[bool]: True if the move finished, False if it was
+            stopped or replaced by another command, None while still running
+        """
+        gripper = self._gripper
+        if self._cancelled or gripper._move_seq != self._seq:
+            return False
+
+        state = gripper._read_state(use_cache=False)
+        if gripper._motion_finished(state, self._position):
+            return True
+
+        status, requested, _ = state
+        if requested == self._position and gripper._GTO_LUT[status]:
+            self._acknowledged = True
+            return None
+        # gGTO dropped or gPR moved on: stopped or replaced outside this
+        # object. Before the first acknowledgement allow the gripper a short
+        # grace period to echo the request.
+        if self._acknowledged or gripper._monotonic() - self._sent_at > gripper._ACK_GRACE:
+            return False
+        return None
+
+    def done(self) -> bool:
+        """
+        Check once whether the move has ended.
+        
+        Returns:
+            bool: True if the gripper finished, was stopped or replaced, or
+            the command was never sent
+        """
+        try:
+            return self._poll() is not None
+        except Exception as e:
+            logger.error("Failed to read status: %s", e)
+            return False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the move ends.
+        
+        Args:
+            timeout: Maximum time to wait (seconds)
+            
+        Returns:
+            bool: True if movement was successful; False if it failed, timed
+            out, or was stopped or replaced before finishing
+        """
+        gripper = self._gripper
+        try:
+            monotonic = gripper._monotonic
+            poll = self._poll
+            deadline = monotonic() + timeout if timeout else None
+            delay = gripper._POLL_MIN_INTERVAL
+            while True:
+                result = poll()
+                if result is not None:
+                    return result
+                if deadline is not None and monotonic() > deadline:
+                    raise TimeoutError("Movement timed out")
+                time.sleep(delay)
+                delay = min(delay * 2, gripper._POLL_MAX_INTERVAL)
+        except Exception as e:
+            logger.error("Movement failed: %s", e)
+            return False
+
+    def cancel(self) -> bool:
+        """
+        Stop the move; ``wait()`` and ``done()`` then report it as ended.
+        
+        Returns:
+            bool: True if stop command was successful
+        """
+        self._cancelled = True
+        return self._gripper.stop()
 
 
 class RQGripper:
     """Robotic Arm Gripper Controller Class"""
+
+    __slots__ = ('_arm', '_handle', '_ip_address', '_port', '_write_params', '_read_params',
+                 '_state_cache', '_cache_ttl', '_read', '_write', '_move_buf', '_activated',
+                 '_io_pool', '_io_lock', '_move_seq')
+
+    # Polling interval bounds (seconds) used while waiting for motion to finish
+    _POLL_MIN_INTERVAL = 0.005
+    _POLL_MAX_INTERVAL = 0.05
+    # Timeout clock; monotonic so wall-clock adjustments cannot skew waits
+    _monotonic = staticmethod(time.monotonic)
+    # How long (seconds) a status read may be reused by the getters
+    _DEFAULT_CACHE_TTL = 0.02
+    # Status byte -> gGTO bit / gOBJ field lookup tables
+    _GTO_LUT = bytes((b >> 3) & 1 for b in range(256))
+    _OBJ_LUT = bytes((b >> 6) & 3 for b in range(256))
+    # Constant command register payloads (rACT/rGTO, reserved, rPR, rSP, rFR)
+    _STOP_PAYLOAD = (1, 0, 0, 0, 0, 0)
+    _ACT_CLEAR = (0, 0, 0, 0, 0, 0)
+    _ACT_SET = (1, 0, 0, 0, 0, 0)
+    # SDK status codes meaning the request never reached / returned from the arm
+    _DISCONNECT_CODES = (-1, -2)
+    # Time (seconds) a new move may take to show up in gPR/gGTO
+    _ACK_GRACE = 0.1
     
     def __init__(self, ip_address: str = "192.168.1.18", port: int = 8080):
         """
@@ -33,27 +206,133 @@ class RQGripper:
             ip_address: IP address of the robotic arm
             port: Port number for communication
         """
+        _ensure_sdk_path()
+        from Robotic_Arm.rm_robot_interface import RoboticArm, rm_thread_mode_e
+
         self._arm = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
+        # Bound SDK register accessors, looked up once for the polling paths
+        self._read = self._arm.rm_read_multiple_input_registers
+        self._write = self._arm.rm_write_registers
         self._handle = None
         self._ip_address = ip_address
         self._port = port
+        self._activated = False
+        self._state_cache = (0.0, None)
+        self._cache_ttl = self._DEFAULT_CACHE_TTL
+        # Single worker keeps Modbus transactions from the async API serialized
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Serializes SDK calls between the blocking API and the async executor;
+        # reentrant because a reconnect runs inside a retried call
+        self._io_lock = threading.RLock()
+        # Reused move command; only position/speed/force change between calls
+        self._move_buf = [9, 0, 0, 0, 0, 0]
+        # Bumped by every move or stop so outstanding futures know they were superseded
+        self._move_seq = 0
         
         self._initialize_connection()
         self._setup_communication_parameters()
+
+    @classmethod
+    def get(cls, ip_address: str = "192.168.1.18", port: int = 8080) -> "RQGripper":
+        """
+        Return the shared gripper connection for an address, creating it on
+        first use. Each (ip_address, port) pair keeps its own connection,
+        which stays open when used as a context manager; call ``close()``
+        to release it.
         
+        Args:
+            ip_address: IP address of the robotic arm
+            port: Port number for communication
+            
+        Returns:
+            RQGripper: Connected gripper controller
+        """
+        key = (ip_address, port)
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = _INSTANCES[key] = cls(ip_address, port)
+        return instance
+
+    def _reconnect(self) -> None:
+        """Drop the current arm handle and set up the connection again."""
+        logger.warning("Reconnecting to robotic arm at %s:%s", self._ip_address, self._port)
+        try:
+            self._arm.rm_delete_robot_arm()
+        except Exception as e:
+            logger.debug("Ignoring error while dropping stale handle: %s", e)
+        self.invalidate_cache()
+        self._activated = False
+        self._initialize_connection()
+        self._setup_communication_parameters()
+
+    def _retry(self, fn, *args, attempts: int = 3, base_delay: float = 0.005):
+        """
+        Call an SDK method, retrying failed attempts with exponential backoff.
+
+        Every command written to the gripper sets absolute register values,
+        so resending one after a lost response is idempotent. A status code
+        meaning the link is down triggers at most one reconnect per call; a
+        reconnect that fails is raised rather than retried.
+        
+        Args:
+            fn: SDK method to call
+            attempts: Maximum number of calls to ``fn``, at least 1
+            base_delay: Delay before the first retry (seconds), doubled each time
+            
+        Returns:
+            The SDK method's return value from the last attempt
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+
+        reconnected = False
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                with self._io_lock:
+                    result = fn(*args)
+            except Exception as e:
+                if last_attempt:
+                    raise
+                logger.debug("%s raised %s, retrying", fn.__name__, e)
+            else:
+                tag = result[0] if isinstance(result, tuple) else result
+                if tag == 0 or last_attempt:
+                    return result
+                if tag in self._DISCONNECT_CODES and not reconnected:
+                    reconnected = True
+                    with self._io_lock:
+                        self._reconnect()
+                    continue
+                logger.debug("%s returned %s, retrying", fn.__name__, tag)
+            time.sleep(base_delay * 2 ** attempt)
+
     def _initialize_connection(self) -> None:
         """Establish connection with the robotic arm."""
+        # The TCP socket is created and owned by the SDK's C library, so socket
+        # options such as TCP_NODELAY/SO_KEEPALIVE cannot be set from Python.
         try:
             self._handle = self._arm.rm_create_robot_arm(self._ip_address, self._port)
-            print(f"Connected to robotic arm at {self._ip_address}:{self._port}")
         except Exception as e:
             raise ConnectionError(f"Failed to connect to robotic arm: {str(e)}")
+
+        # The SDK reports a failed connection through the handle id rather
+        # than an exception; fail fast instead of timing out on every call
+        if self._handle.id == -1:
+            raise ConnectionError(
+                f"Failed to connect to robotic arm at {self._ip_address}:{self._port}"
+            )
+        logger.debug("Connected to robotic arm at %s:%s", self._ip_address, self._port)
     
     def _setup_communication_parameters(self) -> None:
         """Configure Modbus communication parameters."""
+        from Robotic_Arm.rm_robot_interface import rm_peripheral_read_write_params_t
+
         try:
-            print(self._arm.rm_close_modbus_mode(1))
-            print(self._arm.rm_set_modbus_mode(1, 115200, 5))
+            result = self._arm.rm_close_modbus_mode(1)
+            logger.debug("rm_close_modbus_mode returned %s", result)
+            result = self._arm.rm_set_modbus_mode(1, 115200, 5)
+            logger.debug("rm_set_modbus_mode returned %s", result)
             
             # Setup read/write parameters
             self._write_params = rm_peripheral_read_write_params_t(1, 1000, 9, 3)
@@ -64,54 +343,204 @@ class RQGripper:
     def activate(self) -> bool:
         """
         Activate the gripper.
+
+        A fresh status read decides what to send: nothing if the gripper is
+        already activated without a fault, otherwise the activation writes.
         
         Returns:
             bool: True if activation was successful
         """
         try:
-            result1 = self._arm.rm_write_registers(self._write_params, [0, 0, 0, 0, 0, 0])
-            result2 = self._arm.rm_write_registers(self._write_params, [1, 0, 0, 0, 0, 0])
-            return all([result1, result2])
+            try:
+                status = self._read_state(use_cache=False)[0]
+            except RuntimeError:
+                status = None
+
+            if status is not None and self._activated:
+                # gACT set, gSTA reports activation complete and no fault
+                return True
+
+            if status is not None and not status & 1:
+                # rACT is already cleared, a single write produces the 0->1 edge
+                # that also clears any fault
+                result = self._retry(self._write, self._write_params, self._ACT_SET)
+            else:
+                # Unknown, faulted or stale activation state: reset first, then activate
+                result = self._retry(self._write, self._write_params, self._ACT_CLEAR)
+                if result == 0:
+                    result = self._retry(self._write, self._write_params, self._ACT_SET)
+
+            return result == 0
         except Exception as e:
-            print(f"Activation failed: {str(e)}")
+            logger.error("Activation failed: %s", e)
             return False
 
-    def go_to_position(self, position: int, speed: int = 0, force: int = 0, 
-                      wait: bool = True, timeout: Optional[float] = None) -> bool:
+    def go_to_position(self, position: int, speed: int = 0, force: int = 0,
+                       *, strict: bool = False) -> "GripperFuture":
         """
-        Move gripper to specified position.
+        Start moving gripper to specified position without waiting.
+
+        Call ``.wait()`` on the result to block until the move finishes. From
+        asyncio code use ``go_to_position_async``, which awaits the move instead.
+        
+        Args:
+            position: Target position (0-255)
+            speed: Movement speed
+            force: Applied force
+            strict: Raise ValueError for an out-of-range position instead of clamping
+            
+        Returns:
+            GripperFuture: Handle to wait for, poll or cancel the move
+        """
+        position = _clamp_position(position, strict)
+            
+        self.invalidate_cache()
+        self._move_seq += 1
+        move_buf = self._move_buf
+        move_buf[3] = position
+        move_buf[4] = speed
+        move_buf[5] = force
+        try:
+            sent = self._retry(self._write, self._write_params, move_buf) == 0
+        except Exception as e:
+            logger.error("Movement failed: %s", e)
+            sent = False
+        return GripperFuture(self, position, sent)
+
+    async def go_to_position_async(self, position: int, speed: int = 0, force: int = 0,
+                                   timeout: Optional[float] = None,
+                                   *, strict: bool = False) -> bool:
+        """
+        Move gripper to specified position and wait without blocking the event loop.
+
+        Unlike ``go_to_position``, which returns a GripperFuture straight
+        away, the coroutine itself is the handle here: awaiting it waits for
+        the move, and ``asyncio.create_task`` starts it without waiting. The
+        move ends early, returning False, when it is stopped or replaced.
+        Modbus calls run on a single-thread executor, and the event loop is
+        free between polls. SDK calls are serialized with the blocking
+        methods, so both may be used on the same gripper from different threads.
         
         Args:
             position: Target position (0-255)
             speed: Movement speed
             force: Applied force
-            wait: Whether to wait until position is reached
             timeout: Maximum time to wait (seconds)
+            strict: Raise ValueError for an out-of-range position instead of clamping
             
         Returns:
             bool: True if movement was successful
         """
-        if not 0 <= position <= 255:
-            raise ValueError("Position must be between 0 and 255")
-            
+        position = _clamp_position(position, strict)
+
+        loop = asyncio.get_running_loop()
+        self.invalidate_cache()
+        self._move_seq += 1
+        # Taken before the write so a move or stop issued meanwhile supersedes this one
+        seq = self._move_seq
         try:
-            result = self._arm.rm_write_registers(
-                self._write_params, 
-                [9, 0, 0, position, speed, force]
+            result = await loop.run_in_executor(
+                self._io_pool,
+                self._retry,
+                self._write,
+                self._write_params,
+                (9, 0, 0, position, speed, force)
             )
-            
-            if wait:
-                start_time = time.time()
-                while not self.get_position() == position:
-                    if timeout and (time.time() - start_time) > timeout:
-                        raise TimeoutError("Movement timed out")
-                    time.sleep(0.1)
-                    
-            return result
+            if result != 0:
+                return False
+
+            # Share the blocking API's completion/termination rules
+            future = GripperFuture(self, position, True, seq)
+            monotonic = self._monotonic
+            deadline = monotonic() + timeout if timeout else None
+            delay = self._POLL_MIN_INTERVAL
+            while True:
+                finished = await loop.run_in_executor(self._io_pool, future._poll)
+                if finished is not None:
+                    return finished
+                if deadline is not None and monotonic() > deadline:
+                    raise TimeoutError("Movement timed out")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._POLL_MAX_INTERVAL)
         except Exception as e:
-            print(f"Movement failed: {str(e)}")
+            logger.error("Movement failed: %s", e)
             return False
 
+    def execute_trajectory(self, positions: Iterable[int], speed: int = 0, force: int = 0,
+                           dwell: float = 0.0, timeout: Optional[float] = None) -> bool:
+        """
+        Move through a sequence of positions back to back.
+
+        Each target is written as soon as the status read reports the
+        previous move finished, so no fixed sleep is spent between steps.
+        
+        Args:
+            positions: Target positions (0-255), in order
+            speed: Movement speed
+            force: Applied force
+            dwell: Time to hold each position before the next move (seconds)
+            timeout: Maximum time to wait for each move (seconds)
+            
+        Returns:
+            bool: True if every move was successful; stops at the first failure
+        """
+        for position in positions:
+            if not self.go_to_position(position, speed, force).wait(timeout):
+                return False
+            if dwell:
+                time.sleep(dwell)
+        return True
+
+    async def get_position_async(self) -> int:
+        """
+        Get current gripper position without blocking the event loop.
+        
+        Returns:
+            int: Current position (0-255)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, self.get_position)
+
+    @classmethod
+    def _motion_finished(cls, state: Tuple[int, int, int], position: int) -> bool:
+        """Check whether a state read shows the move to ``position`` has ended."""
+        status, requested, current = state
+        if abs(current - position) <= 1:
+            return True
+        # Motion is over once the request is acknowledged (gPR echoes the
+        # target, gGTO set) and gOBJ reports anything but "moving"
+        return bool(requested == position and cls._GTO_LUT[status] and cls._OBJ_LUT[status])
+
+    def _read_state(self, use_cache: bool = True) -> Tuple[int, int, int]:
+        """
+        Read the gripper input registers in a single Modbus transaction.
+
+        Args:
+            use_cache: Reuse a read younger than the cache TTL instead of
+                querying the gripper
+
+        Returns:
+            Tuple[int, int, int]: (status byte, requested position echo, current position)
+        """
+        now = self._monotonic()
+        cache = self._state_cache
+        if use_cache and now - cache[0] < self._cache_ttl:
+            return cache[1]
+
+        tag, data = self._retry(self._read, self._read_params)
+        if tag != 0:
+            raise RuntimeError(f"Modbus read failed with code {tag}")
+        status = data[0]
+        # Track activation from every fresh read so power loss or faults are noticed
+        self._activated = bool(status & 1 and (status >> 4) & 3 == 3 and not data[2])
+        state = (status, data[3], data[4])
+        self._state_cache = (now, state)
+        return state
+
+    def invalidate_cache(self) -> None:
+        """Discard the cached status so the next read queries the gripper."""
+        self._state_cache = (0.0, None)
+
     def get_position(self) -> int:
         """
         Get current gripper position.
@@ -120,10 +549,9 @@ class RQGripper:
             int: Current position (0-255)
         """
         try:
-            data = self._arm.rm_read_multiple_input_registers(self._read_params)
-            return data[1][4]
+            return self._read_state()[2]
         except Exception as e:
-            print(f"Failed to read position: {str(e)}")
+            logger.error("Failed to read position: %s", e)
             return -1
 
     def get_action_status(self) -> int:
@@ -134,15 +562,9 @@ class RQGripper:
             int: Status bit (gGTO bit)
         """
         try:
-            data = self._arm.rm_read_multiple_input_registers(self._read_params)
-            byte_value = data[1][0]
-            
-            if byte_value < 0 or byte_value > 255:
-                raise ValueError("Invalid status byte value")
-                
-            return (byte_value >> 3) & 1
+            return self._GTO_LUT[self._read_state()[0]]
         except Exception as e:
-            print(f"Failed to read status: {str(e)}")
+            logger.error("Failed to read status: %s", e)
             return -1
 
     def stop(self) -> bool:
@@ -152,23 +574,179 @@ class RQGripper:
         Returns:
             bool: True if stop command was successful
         """
+        self.invalidate_cache()
+        self._move_seq += 1
         try:
-            return self._arm.rm_write_registers(
-                self._write_params, 
-                [1, 0, 0, 0, 0, 0]
-            )
+            return self._retry(self._write, self._write_params, self._STOP_PAYLOAD) == 0
         except Exception as e:
-            print(f"Stop command failed: {str(e)}")
+            logger.error("Stop command failed: %s", e)
             return False
 
     def close(self) -> None:
-        """Clean up and close connection."""
+        """Clean up and close connection. Closing again does nothing."""
+        if self._handle is None:
+            return
+        key = (self._ip_address, self._port)
+        if _INSTANCES.get(key) is self:
+            del _INSTANCES[key]
+        self._io_pool.shutdown(wait=True)
         try:
-            if self._handle:
+            with self._io_lock:
                 self._arm.rm_delete_robot_arm()
-                print("Connection closed")
+            logger.debug("Connection closed")
         except Exception as e:
-            print(f"Error during cleanup: {str(e)}")
+            logger.error("Error during cleanup: %s", e)
+        self._handle = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit. The shared instance from ``get()`` stays open."""
+        if _INSTANCES.get((self._ip_address, self._port)) is not self:
+            self.close()
+
+
+def _gripper_worker(ip_address: str, port: int, cmd_q, state, ready, failed,
+                    poll_interval: float) -> None:
+    """
+    Background process body for RQGripperAsync.
+
+    Owns the RQGripper connection, executes queued commands and publishes
+    the latest (status, requested, position) registers into ``state``.
+    """
+    try:
+        gripper = RQGripper(ip_address, port)
+    except Exception as e:
+        logger.error("Gripper worker failed to start: %s", e)
+        failed.set()
+        ready.set()
+        return
+    ready.set()
+
+    with gripper:
+        running = True
+        while running:
+            # Drain everything queued since the last cycle; consecutive moves
+            # collapse to the most recent one
+            commands = []
+            try:
+                commands.append(cmd_q.get(timeout=poll_interval))
+                while True:
+                    commands.append(cmd_q.get_nowait())
+            except queue.Empty:
+                pass
+
+            for i, command in enumerate(commands):
+                if command is None:
+                    running = False
+                    break
+                name, args = command
+                if name == "goto":
+                    next_command = commands[i + 1] if i + 1 < len(commands) else None
+                    if next_command is not None and next_command[0] == "goto":
+                        continue
+                    gripper.go_to_position(*args)
+                elif name == "activate":
+                    gripper.activate()
+                elif name == "stop":
+                    gripper.stop()
+
+            try:
+                state[0], state[1], state[2] = gripper._read_state(use_cache=False)
+            except Exception:
+                state[0], state[1], state[2] = -1, -1, -1
+
+
+class RQGripperAsync:
+    """
+    Gripper controller that runs all Modbus I/O in a background process.
+
+    Commands are queued and return immediately; readers return the latest
+    state published by the worker without touching the bus.
+    """
+
+    # Worker status refresh period (seconds)
+    _POLL_INTERVAL = 0.02
+
+    def __init__(self, ip_address: str = "192.168.1.18", port: int = 8080,
+                 connect_timeout: float = 10.0):
+        """
+        Start the background worker and wait for it to connect.
+        
+        Args:
+            ip_address: IP address of the robotic arm
+            port: Port number for communication
+            connect_timeout: Maximum time to wait for the worker to connect (seconds)
+        """
+        self._cmd_q = multiprocessing.Queue()
+        self._state = multiprocessing.RawArray("i", [-1, -1, -1])
+        ready = multiprocessing.Event()
+        failed = multiprocessing.Event()
+
+        self._process = multiprocessing.Process(
+            target=_gripper_worker,
+            args=(ip_address, port, self._cmd_q, self._state, ready, failed,
+                  self._POLL_INTERVAL),
+            daemon=True
+        )
+        self._process.start()
+
+        if not ready.wait(connect_timeout) or failed.is_set():
+            self._process.terminate()
+            raise ConnectionError(
+                f"Failed to connect to robotic arm at {ip_address}:{port}"
+            )
+
+    def activate(self) -> None:
+        """Queue gripper activation."""
+        self._cmd_q.put(("activate", ()))
+
+    def go_to_position(self, position: int, speed: int = 0, force: int = 0,
+                       *, strict: bool = False) -> None:
+        """
+        Queue a move; a newer move queued before this one is sent replaces it.
+        
+        Args:
+            position: Target position (0-255)
+            speed: Movement speed
+            force: Applied force
+            strict: Raise ValueError for an out-of-range position instead of clamping
+        """
+        position = _clamp_position(position, strict)
+        self._cmd_q.put(("goto", (position, speed, force)))
+
+    def stop(self) -> None:
+        """Queue an immediate stop."""
+        self._cmd_q.put(("stop", ()))
+
+    def get_position(self) -> int:
+        """
+        Get the latest gripper position published by the worker.
+        
+        Returns:
+            int: Current position (0-255), or -1 if unavailable
+        """
+        return self._state[2]
+
+    def get_action_status(self) -> int:
+        """
+        Get the latest gripper action status published by the worker.
+        
+        Returns:
+            int: Status bit (gGTO bit), or -1 if unavailable
+        """
+        status = self._state[0]
+        return -1 if status < 0 else RQGripper._GTO_LUT[status]
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Shut down the worker and close its connection."""
+        if self._process.is_alive():
+            self._cmd_q.put(None)
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
 
     def __enter__(self):
         """Context manager entry."""
@@ -184,17 +762,15 @@ def main():
     try:
         with RQGripper() as gripper:
             # Example movement sequence
-            gripper.go_to_position(128, wait=True, timeout=5.0)
+            gripper.go_to_position(128).wait(timeout=5.0)
             print(f"Current position: {gripper.get_position()}")
             
-            gripper.go_to_position(50, wait=True)
+            gripper.go_to_position(50).wait()
             print(f"Current position: {gripper.get_position()}")
             
             # Demonstrate incremental movement
-            for pos in range(50, 200, 25):
-                gripper.go_to_position(pos)
-                print(f"Moved to position: {pos}")
-                time.sleep(0.5)
+            gripper.execute_trajectory(range(50, 200, 25), timeout=5.0)
+            print(f"Current position: {gripper.get_position()}")
                 
     except Exception as e:
         print(f"Error in main execution: {str(e)}")
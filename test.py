@@ -1,6 +1,7 @@
 import sys
 import os
 import time
+import logging
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(ROOT_DIR)
@@ -8,6 +9,8 @@ sys.path.append(os.path.join(ROOT_DIR, "Python"))
 sys.path.append(os.path.join(ROOT_DIR, "Python", "Robotic_Arm"))
 from Robotic_Arm.rm_robot_interface import *
 
+logger = logging.getLogger(__name__)
+
 
 class Rqgripper():
 
@@ -17,14 +20,15 @@ class Rqgripper():
 
         # 创建机械臂连接，打印连接id
         self.handle = self.arm.rm_create_robot_arm("192.168.1.18", 8080)
-        print(self.arm.rm_close_modbus_mode(1))
-        print(self.arm.rm_set_modbus_mode(1, 115200, 5))
+        logger.debug("close modbus mode: %s", self.arm.rm_close_modbus_mode(1))
+        logger.debug("set modbus mode: %s", self.arm.rm_set_modbus_mode(1, 115200, 5))
         self.write_params = rm_peripheral_read_write_params_t(1, 1000, 9, 3)
         self.read_params = rm_peripheral_read_write_params_t(1, 2000, 9, 3)
 
     def activate(self):
-        print(self.arm.rm_write_registers(self.write_params, [0, 0, 0, 0, 0, 0]))
-        print(self.arm.rm_write_registers(self.write_params, [1, 0, 0, 0, 0, 0]))
+        result1 = self.arm.rm_write_registers(self.write_params, [0, 0, 0, 0, 0, 0])
+        result2 = self.arm.rm_write_registers(self.write_params, [1, 0, 0, 0, 0, 0])
+        return result1, result2
 
 
     def goToPosition_once(self, position, speed = 0, force = 0 ):
@@ -33,17 +37,35 @@ class Rqgripper():
         return self.arm.rm_write_registers(self.write_params, [9, 0, 0, position, speed, force])
 
 
-    def goToPosition(self, position, speed = 0, force = 0 ):
+    def goToPosition(self, position, speed = 0, force = 0, timeout = None):
 
+        # 位置限制在0-255范围内，避免超出范围后永远等不到目标位置
+        position = min(max(position, 0), 255)
         self.arm.rm_write_registers(self.write_params, [9, 0, 0, position, speed, force])
 
-        while not (self.getPosition() >= position):
-            continue
+        # 轮询间隔从5ms开始指数退避至50ms，避免空转占满CPU和Modbus总线
+        delay = 0.005
+        deadline = time.monotonic() + timeout if timeout else None
+        while not self._reached(position):
+            # 超时返回-1，避免夹爪被物体挡住时无限等待
+            if deadline is not None and time.monotonic() > deadline:
+                return -1
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
 
         return 0
 
 
 
+    def _reached(self, position):
+        # 到达目标位置(允许1个单位误差)即完成，张开和闭合两个方向都适用；
+        # 否则需gPR回显目标且gGTO置位，gOBJ非0(到位或检测到物体)才算完成，
+        # 避免沿用上一次动作残留的gOBJ
+        status, _, _, requested, current = self.arm.rm_read_multiple_input_registers(self.read_params)[1][:5]
+        if abs(current - position) <= 1:
+            return True
+        return requested == position and (status >> 3) & 1 == 1 and (status >> 6) & 3 != 0
+
     def getPosition(self):
         data = self.arm.rm_read_multiple_input_registers(self.read_params)
 
@@ -86,13 +108,10 @@ def main():
     print(data)
 
 
-    gripper.goToPosition(5)
-
-    while True:
-
-        pos = gripper.getPosition()
-
-        gripper.goToPosition(pos + 15)
+    # 先等待夹爪张开到5，再从5开始以15为步长逐步闭合到255，每步等待到位（最多2秒）
+    gripper.goToPosition(5, timeout=2.0)
+    for target in range(5, 255, 15):
+        gripper.goToPosition(target, timeout=2.0)
 
 
 
@@ -0,0 +1,434 @@
+"""
+Smoke tests for RQGripper against a stubbed Robotic_Arm SDK.
+
+The real SDK loads a native library and needs an arm on the network, so
+these tests swap in a small register-level simulation of the Robotiq
+gripper behind the same RoboticArm interface.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import queue
+import types
+import threading
+import unittest
+import multiprocessing
+from unittest import mock
+
+
+class _Handle:
+    """Stand-in for rm_robot_handle, which the SDK returns by value."""
+
+    def __init__(self, id):
+        self.id = id
+
+
+class _FakeArm:
+    """Simulated arm forwarding register access to a Robotiq gripper."""
+
+    connect_id = 1
+
+    def __init__(self, mode=None):
+        _FakeArm.last = self
+        self.calls = []
+        self.fault = 0
+        self.status = 0
+        self.requested = 0
+        self.position = 0
+        # Whether a move request completes immediately
+        self.instant = True
+        # Status codes to return from the next reads/writes, before behaving normally
+        self.read_codes = []
+        self.write_codes = []
+
+    def writes(self):
+        """Payloads written so far, in order."""
+        return [call[1] for call in self.calls if isinstance(call, tuple)]
+
+    def rm_create_robot_arm(self, ip, port):
+        self.calls.append("create")
+        return _Handle(self.connect_id)
+
+    def rm_delete_robot_arm(self):
+        self.calls.append("delete")
+        return 0
+
+    def rm_close_modbus_mode(self, port):
+        return 0
+
+    def rm_set_modbus_mode(self, port, baudrate, timeout):
+        return 0
+
+    def rm_write_registers(self, params, data):
+        data = list(data)
+        self.calls.append(("write", tuple(data)))
+        if self.write_codes:
+            return self.write_codes.pop(0)
+        if not data[0] & 1:
+            self.status = 0
+            self.fault = 0
+            return 0
+        self.status |= 1 | (3 << 4)
+        if data[0] & 8:
+            self.requested = data[3]
+            self.status = (self.status | 8) & 0x3F
+            if self.instant:
+                self.position = data[3]
+                self.status |= 3 << 6
+        else:
+            self.status &= ~8 & 0x3F
+        return 0
+
+    def rm_read_multiple_input_registers(self, params):
+        self.calls.append("read")
+        if self.read_codes:
+            return self.read_codes.pop(0), [0] * 6
+        return 0, [self.status, 0, self.fault, self.requested, self.position, 0]
+
+
+def _fake_sdk():
+    module = types.ModuleType("Robotic_Arm.rm_robot_interface")
+    module.RoboticArm = _FakeArm
+    module.rm_thread_mode_e = types.SimpleNamespace(RM_TRIPLE_MODE_E=2)
+    module.rm_peripheral_read_write_params_t = lambda *args: args
+    return module
+
+
+# Installed before RQGripper is imported so the stub is picked up in place of
+# the native SDK; forked worker processes inherit it as well
+sys.modules["Robotic_Arm.rm_robot_interface"] = _fake_sdk()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import RQGripper as rq
+
+
+class RQGripperSmokeTest(unittest.TestCase):
+
+    def test_connect_and_move(self):
+        with rq.RQGripper() as gripper:
+            self.assertTrue(gripper.activate())
+            self.assertTrue(gripper.go_to_position(128).wait(timeout=1.0))
+            self.assertEqual(gripper.get_position(), 128)
+            self.assertEqual(gripper.get_action_status(), 1)
+
+    def test_activate_skips_writes_when_active(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.calls.clear()
+            self.assertTrue(gripper.activate())
+            self.assertEqual(gripper._arm.calls, ["read"])
+
+    def test_activate_from_cleared_state_writes_once(self):
+        with rq.RQGripper() as gripper:
+            self.assertTrue(gripper.activate())
+            self.assertEqual(gripper._arm.writes(), [(1, 0, 0, 0, 0, 0)])
+
+    def test_activate_resets_after_fault_or_power_loss(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            arm = gripper._arm
+
+            arm.fault = 0x07
+            arm.calls.clear()
+            self.assertTrue(gripper.activate())
+            self.assertEqual(arm.writes(), [(0,) * 6, (1, 0, 0, 0, 0, 0)])
+
+            arm.status = 0
+            arm.calls.clear()
+            self.assertTrue(gripper.activate())
+            self.assertEqual(arm.writes(), [(1, 0, 0, 0, 0, 0)])
+
+    def test_reconnect_forgets_activation(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._reconnect()
+            self.assertFalse(gripper._activated)
+
+    def test_getters_share_one_read_within_ttl(self):
+        with rq.RQGripper() as gripper:
+            arm = gripper._arm
+            arm.calls.clear()
+            gripper.get_position()
+            gripper.get_action_status()
+            self.assertEqual(arm.calls.count("read"), 1)
+
+    def test_commands_invalidate_cache(self):
+        with rq.RQGripper() as gripper:
+            gripper.get_position()
+            gripper.go_to_position(42)
+            self.assertEqual(gripper.get_position(), 42)
+
+            gripper.get_action_status()
+            gripper.stop()
+            self.assertIsNone(gripper._state_cache[1])
+            self.assertEqual(gripper.get_action_status(), 0)
+
+            gripper.get_position()
+            gripper.invalidate_cache()
+            self.assertIsNone(gripper._state_cache[1])
+
+
+    def test_async_move(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            self.assertTrue(asyncio.run(gripper.go_to_position_async(90, timeout=1.0)))
+            self.assertEqual(asyncio.run(gripper.get_position_async()), 90)
+
+            gripper._arm.write_codes = [1, 1, 1]
+            self.assertFalse(asyncio.run(gripper.go_to_position_async(10)))
+
+    def test_out_of_range_position_is_clamped(self):
+        with rq.RQGripper() as gripper:
+            self.assertTrue(gripper.go_to_position(400).wait(timeout=1.0))
+            self.assertEqual(gripper.get_position(), 255)
+            self.assertTrue(gripper.go_to_position(-5).wait(timeout=1.0))
+            self.assertEqual(gripper.get_position(), 0)
+            with self.assertRaises(ValueError):
+                gripper.go_to_position(400, strict=True)
+
+    def test_get_reuses_shared_connection(self):
+        gripper = rq.RQGripper.get("10.0.0.1", 8080)
+        self.addCleanup(gripper.close)
+        other = rq.RQGripper.get("10.0.0.2", 8080)
+        self.addCleanup(other.close)
+        self.assertIs(rq.RQGripper.get("10.0.0.1", 8080), gripper)
+        self.assertIsNot(other, gripper)
+        # Asking for another address leaves existing connections open
+        self.assertNotIn("delete", gripper._arm.calls)
+
+        gripper.close()
+        replacement = rq.RQGripper.get("10.0.0.1", 8080)
+        self.addCleanup(replacement.close)
+        self.assertIsNot(replacement, gripper)
+
+    def test_close_twice_deletes_once(self):
+        gripper = rq.RQGripper()
+        gripper.close()
+        gripper.close()
+        self.assertEqual(gripper._arm.calls.count("delete"), 1)
+
+    def test_shared_connection_survives_with_block(self):
+        with rq.RQGripper.get("10.0.0.3", 8080) as gripper:
+            pass
+        self.addCleanup(gripper.close)
+        self.assertNotIn("delete", gripper._arm.calls)
+        self.assertIs(rq.RQGripper.get("10.0.0.3", 8080), gripper)
+
+    def test_dropped_link_reconnects_and_retries(self):
+        with rq.RQGripper() as gripper:
+            arm = gripper._arm
+            arm.read_codes = [-2]
+            arm.calls.clear()
+            self.assertEqual(gripper.get_position(), 0)
+            self.assertEqual(arm.calls, ["read", "delete", "create", "read"])
+
+    def test_move_returns_future(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.instant = False
+            future = gripper.go_to_position(150)
+            self.assertFalse(future.done())
+            gripper._arm.position = 150
+            gripper._arm.status |= 3 << 6
+            self.assertTrue(future.done())
+            self.assertTrue(future.wait(timeout=1.0))
+
+    def test_failed_write_future_does_not_wait(self):
+        with rq.RQGripper() as gripper:
+            gripper._arm.write_codes = [1, 1, 1]
+            future = gripper.go_to_position(150)
+            self.assertTrue(future.done())
+            self.assertFalse(future.wait())
+
+    def test_cancelled_move_ends_wait(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.instant = False
+            future = gripper.go_to_position(200)
+            self.assertFalse(future.done())
+            self.assertTrue(future.cancel())
+            self.assertTrue(future.done())
+            self.assertFalse(future.wait())
+
+    def test_replaced_move_ends_wait(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.instant = False
+            first = gripper.go_to_position(200)
+            gripper.go_to_position(100)
+            self.assertFalse(first.wait())
+
+    def test_finished_move_keeps_its_outcome(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            first = gripper.go_to_position(100)
+            self.assertTrue(first.wait(timeout=1.0))
+            self.assertTrue(gripper.go_to_position(50).wait(timeout=1.0))
+            gripper._arm.calls.clear()
+            self.assertTrue(first.done())
+            self.assertTrue(first.wait())
+            self.assertNotIn("read", gripper._arm.calls)
+
+    def test_move_stopped_elsewhere_ends_wait(self):
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            arm = gripper._arm
+            arm.instant = False
+            future = gripper.go_to_position(200)
+            self.assertFalse(future.done())
+            # Another client stops the gripper: gGTO drops to 0
+            arm.rm_write_registers(None, (1, 0, 0, 0, 0, 0))
+            self.assertFalse(future.wait())
+
+    def test_transient_failures_are_retried(self):
+        with rq.RQGripper() as gripper:
+            gripper.go_to_position(60).wait(timeout=1.0)
+            arm = gripper._arm
+            arm.read_codes = [1, 1]
+            arm.calls.clear()
+            self.assertEqual(gripper._read_state(use_cache=False)[2], 60)
+            self.assertEqual(arm.calls.count("read"), 3)
+
+            arm.read_codes = [1, 1, 1]
+            gripper.invalidate_cache()
+            self.assertEqual(gripper.get_position(), -1)
+
+    def test_retry_reconnects_once(self):
+        with rq.RQGripper() as gripper:
+            arm = gripper._arm
+            arm.read_codes = [-2, -2, -2]
+            arm.calls.clear()
+            self.assertEqual(gripper.get_position(), -1)
+            self.assertEqual(arm.calls.count("create"), 1)
+            self.assertEqual(arm.calls.count("read"), 3)
+
+    def test_retry_propagates_failed_reconnect(self):
+        with rq.RQGripper() as gripper:
+            gripper._arm.read_codes = [-1]
+            with mock.patch.object(_FakeArm, "connect_id", -1):
+                with self.assertRaises(ConnectionError):
+                    gripper._read_state(use_cache=False)
+            with self.assertRaises(ValueError):
+                gripper._retry(gripper._read, gripper._read_params, attempts=0)
+
+    def test_trajectory_runs_every_move(self):
+        with rq.RQGripper() as gripper:
+            self.assertTrue(gripper.execute_trajectory([10, 20, 30], timeout=1.0))
+            self.assertEqual(gripper.get_position(), 30)
+
+    def test_trajectory_stops_at_first_failed_move(self):
+        original_write = _FakeArm.rm_write_registers
+
+        def write(arm, params, data):
+            result = original_write(arm, params, data)
+            return 1 if data[3] == 20 else result
+
+        with mock.patch.object(_FakeArm, "rm_write_registers", write), rq.RQGripper() as gripper:
+            self.assertFalse(gripper.execute_trajectory([10, 20, 30], timeout=1.0))
+            self.assertNotIn((9, 0, 0, 30, 0, 0), gripper._arm.writes())
+
+    def test_async_move_ends_when_stopped(self):
+        async def move_then_stop(gripper):
+            task = asyncio.create_task(gripper.go_to_position_async(200))
+            await asyncio.sleep(0.02)
+            gripper.stop()
+            return await asyncio.wait_for(task, 1.0)
+
+        with rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.instant = False
+            self.assertFalse(asyncio.run(move_then_stop(gripper)))
+
+    def test_stop_during_async_write_ends_move(self):
+        writing = threading.Event()
+        release = threading.Event()
+        original_write = _FakeArm.rm_write_registers
+
+        def write(arm, params, data):
+            if data[0] & 8:
+                writing.set()
+                release.wait(1.0)
+            return original_write(arm, params, data)
+
+        async def move_with_blocking_stop(gripper):
+            task = asyncio.create_task(gripper.go_to_position_async(200, timeout=1.0))
+            await asyncio.get_running_loop().run_in_executor(None, writing.wait, 1.0)
+            # Blocks on the SDK lock until the async write has gone through
+            stopper = threading.Thread(target=gripper.stop)
+            stopper.start()
+            release.set()
+            result = await asyncio.wait_for(task, 1.0)
+            stopper.join(1.0)
+            return result
+
+        with mock.patch.object(_FakeArm, "rm_write_registers", write), rq.RQGripper() as gripper:
+            gripper.activate()
+            gripper._arm.instant = False
+            self.assertFalse(asyncio.run(move_with_blocking_stop(gripper)))
+            self.assertEqual(gripper._arm.writes()[-1], rq.RQGripper._STOP_PAYLOAD)
+
+    def test_failed_connection_raises(self):
+        with mock.patch.object(_FakeArm, "connect_id", -1):
+            with self.assertRaises(ConnectionError):
+                rq.RQGripper()
+
+
+class RQGripperAsyncTest(unittest.TestCase):
+
+    def test_worker_collapses_consecutive_moves(self):
+        cmd_q = queue.Queue()
+        for command in (("activate", ()), ("goto", (10, 0, 0)), ("goto", (20, 0, 0)),
+                        ("goto", (30, 0, 0)), ("stop", ()), ("goto", (40, 0, 0)), None):
+            cmd_q.put(command)
+        state = [-1, -1, -1]
+
+        rq._gripper_worker("10.0.0.1", 8080, cmd_q, state, threading.Event(),
+                           threading.Event(), 0.01)
+
+        moves = [w[3] for w in _FakeArm.last.writes() if w[0] & 8]
+        self.assertEqual(moves, [30, 40])
+
+    def test_worker_reports_connect_failure(self):
+        ready, failed = threading.Event(), threading.Event()
+        with mock.patch.object(_FakeArm, "rm_create_robot_arm", side_effect=OSError("down")):
+            rq._gripper_worker("10.0.0.1", 8080, queue.Queue(), [-1, -1, -1],
+                               ready, failed, 0.01)
+        self.assertTrue(ready.is_set())
+        self.assertTrue(failed.is_set())
+
+
+@unittest.skipUnless(multiprocessing.get_start_method() == "fork",
+                     "the stub SDK reaches the worker only through fork")
+class RQGripperAsyncProcessTest(unittest.TestCase):
+
+    def _wait_for_position(self, gripper, position):
+        deadline = time.monotonic() + 2.0
+        while gripper.get_position() != position and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return gripper.get_position()
+
+    def test_moves_and_publishes_state(self):
+        with rq.RQGripperAsync() as gripper:
+            gripper.activate()
+            gripper.go_to_position(77)
+            self.assertEqual(self._wait_for_position(gripper, 77), 77)
+            self.assertEqual(gripper.get_action_status(), 1)
+
+            # Out-of-range targets are clamped in the parent before queueing
+            gripper.go_to_position(400)
+            self.assertEqual(self._wait_for_position(gripper, 255), 255)
+            with self.assertRaises(ValueError):
+                gripper.go_to_position(400, strict=True)
+        self.assertFalse(gripper._process.is_alive())
+        gripper.close()
+
+    def test_connect_failure_raises(self):
+        with mock.patch.object(_FakeArm, "rm_create_robot_arm", side_effect=OSError("down")):
+            with self.assertRaises(ConnectionError):
+                rq.RQGripperAsync()
+
+
+if __name__ == "__main__":
+    unittest.main()